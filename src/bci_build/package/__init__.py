@@ -4,9 +4,10 @@ import abc
 import asyncio
 import datetime
 import enum
+import functools
 import os
+import string
 import textwrap
-from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
@@ -20,10 +21,14 @@ from bci_build.templates import DOCKERFILE_TEMPLATE
 from bci_build.templates import INFOHEADER_TEMPLATE
 from bci_build.templates import KIWI_TEMPLATE
 from bci_build.templates import SERVICE_TEMPLATE
-from bci_build.util import write_to_file
 
 _BASH_SET: str = "set -euo pipefail"
 
+#: The current year, evaluated once at import time. Querying the clock and
+#: formatting the year on every property access adds up over a full matrix
+#: build. Tests can monkeypatch this attribute to freeze the year.
+_CURRENT_YEAR: int = datetime.datetime.now().year
+
 #: a ``RUN`` command with a common set of bash flags applied to prevent errors
 #: from not being noticed
 DOCKERFILE_RUN: str = f"RUN {_BASH_SET};"
@@ -32,9 +37,54 @@ DOCKERFILE_RUN: str = f"RUN {_BASH_SET};"
 #: that would also remove some package owned directories (not %ghost)
 LOG_CLEAN: str = "rm -rf /var/log/{lastlog,tallylog,zypper.log,zypp/history,YaST2}"
 
+#: Template of the :file:`config.sh` script for kiwi builds. The static body is
+#: assembled once at import time; the interpreter, the per-image script and the
+#: copyright year are substituted in :py:attr:`BaseContainerImage.config_sh`
+#: (``safe_substitute`` keeps the shell variables like ``$kiwi_iname`` intact).
+_CONFIG_SH_TEMPLATE = string.Template(f"""#!${{config_sh_interpreter}}
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: (c) 2022-${{current_year}} SUSE LLC
+
+{_BASH_SET}
+
+test -f /.kconfig && . /.kconfig
+test -f /.profile && . /.profile
+
+echo "Configure image: [$kiwi_iname]..."
+
+#============================================
+# Import repositories' keys if rpm is present
+#--------------------------------------------
+if command -v rpm > /dev/null; then
+    suseImportBuildKey
+fi
+
+${{config_sh_script}}
+
+#=======================================
+# Clean up after zypper if it is present
+#---------------------------------------
+if command -v zypper > /dev/null; then
+    zypper -n clean
+fi
+
+{LOG_CLEAN}
+
+exit 0
+""")
+
+#: Jinja2 environment for rendering the :file:`README.md` of every
+#: image. Sharing one environment lets the templates included via
+#: ``{% include %}`` (badges, licensing boilerplate) be compiled once instead
+#: of per README.
+_README_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"),
+    autoescape=jinja2.select_autoescape(["md"]),
+)
+
 
 @enum.unique
-class Arch(enum.Enum):
+class Arch(enum.StrEnum):
     """Architectures of packages on OBS"""
 
     X86_64 = "x86_64"
@@ -43,35 +93,26 @@ class Arch(enum.Enum):
     S390X = "s390x"
     LOCAL = "local"
 
-    def __str__(self) -> str:
-        return self.value
-
 
 @enum.unique
-class ReleaseStage(enum.Enum):
+class ReleaseStage(enum.StrEnum):
     """Values for the ``release-stage`` label of a BCI"""
 
     BETA = "beta"
     RELEASED = "released"
 
-    def __str__(self) -> str:
-        return self.value
-
 
 @enum.unique
-class ImageType(enum.Enum):
+class ImageType(enum.StrEnum):
     """Values of the ``image-type`` label of a BCI"""
 
     LTSS = "ltss"
     SLE_BCI = "sle-bci"
     APPLICATION = "application"
 
-    def __str__(self) -> str:
-        return self.value
-
 
 @enum.unique
-class BuildType(enum.Enum):
+class BuildType(enum.StrEnum):
     """Options for how the image is build, either as a kiwi build or from a
     :file:`Dockerfile`.
 
@@ -80,12 +121,9 @@ class BuildType(enum.Enum):
     DOCKER = "docker"
     KIWI = "kiwi"
 
-    def __str__(self) -> str:
-        return self.value
-
 
 @enum.unique
-class SupportLevel(enum.Enum):
+class SupportLevel(enum.StrEnum):
     """Potential values of the ``com.suse.supportlevel`` label."""
 
     L2 = "l2"
@@ -95,12 +133,9 @@ class SupportLevel(enum.Enum):
     UNSUPPORTED = "unsupported"
     TECHPREVIEW = "techpreview"
 
-    def __str__(self) -> str:
-        return self.value
-
 
 @enum.unique
-class PackageType(enum.Enum):
+class PackageType(enum.StrEnum):
     """Package types that are supported by kiwi, see
     `<https://osinside.github.io/kiwi/concept_and_workflow/packages.html>`_ for
     further details.
@@ -114,8 +149,15 @@ class PackageType(enum.Enum):
     BOOTSTRAP = "bootstrap"
     IMAGE = "image"
 
-    def __str__(self) -> str:
-        return self.value
+
+#: Order in which the ``<packages>`` elements appear in a kiwi build
+#: description
+_KIWI_PKG_TYPES: tuple[PackageType, ...] = (
+    PackageType.DELETE,
+    PackageType.BOOTSTRAP,
+    PackageType.IMAGE,
+    PackageType.UNINSTALL,
+)
 
 
 @enum.unique
@@ -282,11 +324,15 @@ ALL_OS_VERSIONS: set[OsVersion] = {
     v for v in (*ALL_BASE_OS_VERSIONS, *ALL_NONBASE_OS_VERSIONS)
 }
 
-CAN_BE_LATEST_OS_VERSION: list[OsVersion] = [
-    OsVersion.SP6,
-    OsVersion.TUMBLEWEED,
-    OsVersion.SLE16_0,
-]
+# OS versions for which the :latest tag may be created; only ever used for
+# membership tests, hence a frozenset
+CAN_BE_LATEST_OS_VERSION: frozenset[OsVersion] = frozenset(
+    (
+        OsVersion.SP6,
+        OsVersion.TUMBLEWEED,
+        OsVersion.SLE16_0,
+    )
+)
 
 
 # End of General Support Dates
@@ -298,7 +344,7 @@ _SUPPORTED_UNTIL_SLE: dict[OsVersion, datetime.date | None] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Representation of a package in a kiwi build, for Dockerfile based builds the
     :py:attr:`~Package.pkg_type`.
@@ -325,7 +371,7 @@ class ParseVersion(enum.StrEnum):
     OFFSET = enum.auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Replacement:
     """Represents a replacement via the `obs-service-replace_using_package_version
     <https://github.com/openSUSE/obs-service-replace_using_package_version>`_.
@@ -431,9 +477,7 @@ class BaseContainerImage(abc.ABC):
     exposes_tcp: list[int] | None = None
 
     #: Extra environment variables to be set in the container
-    env: dict[str, str | int] | dict[str, str] | dict[str, int] = field(
-        default_factory=dict
-    )
+    env: dict[str, str | int] = field(default_factory=dict)
 
     #: Add any replacements via `obs-service-replace_using_package_version
     #: <https://github.com/openSUSE/obs-service-replace_using_package_version>`_
@@ -445,7 +489,9 @@ class BaseContainerImage(abc.ABC):
     #  within the "labelprefix" section.
     extra_labels: dict[str, str] = field(default_factory=dict)
 
-    #: Packages to be installed inside the container image
+    #: Packages to be installed inside the container image.
+    #: Plain strings are promoted to :py:class:`Package` instances of type
+    #: :py:attr:`PackageType.IMAGE` in :py:meth:`__post_init__`.
     package_list: list[str] | list[Package] = field(default_factory=list)
 
     #: This string is appended to the automatically generated dockerfile and can
@@ -478,9 +524,7 @@ class BaseContainerImage(abc.ABC):
 
     #: Additional files that belong into this container-package.
     #: The key is the filename, the values are the file contents.
-    extra_files: dict[str, str | bytes] | dict[str, bytes] | dict[str, str] = field(
-        default_factory=dict
-    )
+    extra_files: dict[str, str | bytes] = field(default_factory=dict)
 
     #: Additional names under which this image should be published alongside
     #: :py:attr:`~BaseContainerImage.name`.
@@ -532,8 +576,16 @@ class BaseContainerImage(abc.ABC):
     def __post_init__(self) -> None:
         self.pretty_name = self.pretty_name.strip()
 
+        self.package_list = [
+            Package(pkg) if isinstance(pkg, str) else pkg for pkg in self.package_list
+        ]
         if not self.package_list:
             raise ValueError(f"No packages were added to {self.pretty_name}.")
+
+        # callers pass e.g. version numbers as ints, but everything down the
+        # line (env_lines, kiwi_env_entry) only ever needs the str form
+        if self.env:
+            self.env = {k: str(v) for k, v in self.env.items()}
         if self.exclusive_arch and Arch.LOCAL in self.exclusive_arch:
             raise ValueError(f"{Arch.LOCAL} must not appear in {self.exclusive_arch=}")
         if self.config_sh_script and self.custom_end:
@@ -679,7 +731,7 @@ class BaseContainerImage(abc.ABC):
             return "registry.opensuse.org"
         return "registry.suse.com"
 
-    @property
+    @functools.cached_property
     def dockerfile_custom_end(self) -> str:
         """This part is appended at the end of the :file:`Dockerfile`. It is either
         generated from :py:attr:`BaseContainerImage.custom_end` or by prepending
@@ -746,44 +798,18 @@ class BaseContainerImage(abc.ABC):
     def cmd_kiwi(self) -> str | None:
         return self._cmd_entrypoint_kiwi("subcommand", self.cmd)
 
-    @property
+    @functools.cached_property
     def config_sh(self) -> str:
         """The full :file:`config.sh` script required for kiwi builds."""
         if not self.config_sh_script and self.custom_end:
             raise ValueError(
                 "This image cannot be build as a kiwi image, it has a `custom_end` set."
             )
-        return f"""#!{self.config_sh_interpreter}
-# SPDX-License-Identifier: MIT
-# SPDX-FileCopyrightText: (c) 2022-{datetime.datetime.now().date().strftime("%Y")} SUSE LLC
-
-{_BASH_SET}
-
-test -f /.kconfig && . /.kconfig
-test -f /.profile && . /.profile
-
-echo "Configure image: [$kiwi_iname]..."
-
-#============================================
-# Import repositories' keys if rpm is present
-#--------------------------------------------
-if command -v rpm > /dev/null; then
-    suseImportBuildKey
-fi
-
-{self.config_sh_script}
-
-#=======================================
-# Clean up after zypper if it is present
-#---------------------------------------
-if command -v zypper > /dev/null; then
-    zypper -n clean
-fi
-
-{LOG_CLEAN}
-
-exit 0
-"""
+        return _CONFIG_SH_TEMPLATE.safe_substitute(
+            config_sh_interpreter=self.config_sh_interpreter,
+            config_sh_script=self.config_sh_script,
+            current_year=_CURRENT_YEAR,
+        )
 
     @property
     def _from_image(self) -> str | None:
@@ -817,7 +843,7 @@ exit 0
             f" derived_from=\"obsrepositories:/{self._from_image.replace(':', '#')}\""
         )
 
-    @property
+    @functools.cached_property
     def packages(self) -> str:
         """The list of packages joined so that it can be appended to a
         :command:`zypper in`.
@@ -908,53 +934,40 @@ exit 0
     def expose_dockerfile(self) -> str:
         return self._dockerfile_volume_expose("EXPOSE", self.exposes_tcp)
 
-    @property
+    @functools.cached_property
+    def _packages_by_type(self) -> dict[PackageType, list[Package]]:
+        """The packages from :py:attr:`package_list` grouped by their
+        :py:attr:`~Package.pkg_type`, in the order in which the ``<packages>``
+        elements appear in a kiwi build description.
+
+        """
+        grouped: dict[PackageType, list[Package]] = {
+            pkg_type: [] for pkg_type in _KIWI_PKG_TYPES
+        }
+        for pkg in self.package_list:
+            grouped[pkg.pkg_type].append(pkg)
+        return grouped
+
+    @functools.cached_property
     def kiwi_packages(self) -> str:
         """The package list as xml elements that are inserted into a kiwi build
         description file.
         """
 
-        def create_pkg_filter_func(
-            pkg_type: PackageType,
-        ) -> Callable[[str | Package], bool]:
-            def pkg_filter_func(p: str | Package) -> bool:
-                if isinstance(p, str):
-                    return pkg_type == PackageType.IMAGE
-                return p.pkg_type == pkg_type
-
-            return pkg_filter_func
-
-        def pkg_listing_func(pkg: Package) -> str:
-            return f'<package name="{pkg}"/>'
-
-        PKG_TYPES = (
-            PackageType.DELETE,
-            PackageType.BOOTSTRAP,
-            PackageType.IMAGE,
-            PackageType.UNINSTALL,
-        )
-        delete_packages, bootstrap_packages, image_packages, uninstall_packages = (
-            list(filter(create_pkg_filter_func(pkg_type), self.package_list))
-            for pkg_type in PKG_TYPES
-        )
-
-        res = ""
-        for pkg_list, pkg_type in zip(
-            (delete_packages, bootstrap_packages, image_packages, uninstall_packages),
-            PKG_TYPES,
-        ):
+        parts = []
+        for pkg_type, pkg_list in self._packages_by_type.items():
             if pkg_list:
-                res += (
+                parts.append(
                     f"""  <packages type="{pkg_type}">
     """
-                    + "\n    ".join(pkg_listing_func(pkg) for pkg in pkg_list)
+                    + "\n    ".join(f'<package name="{pkg}"/>' for pkg in pkg_list)
                     + """
   </packages>
 """
                 )
-        return res
+        return "".join(parts)
 
-    @property
+    @functools.cached_property
     def env_lines(self) -> str:
         """Part of the :file:`Dockerfile` that sets every environment variable defined
         in :py:attr:`~BaseContainerImage.env`.
@@ -963,10 +976,12 @@ exit 0
         return (
             ""
             if not self.env
-            else "\n" + "\n".join(f'ENV {k}="{v}"' for k, v in self.env.items()) + "\n"
+            else "\n"
+            + "\n".join([f'ENV {k}="{v}"' for k, v in self.env.items()])
+            + "\n"
         )
 
-    @property
+    @functools.cached_property
     def kiwi_env_entry(self) -> str:
         """Environment variable settings for a kiwi build recipe."""
         if not self.env:
@@ -975,7 +990,7 @@ exit 0
             """\n        <environment>
           """
             + """
-          """.join(f'<env name="{k}" value="{v}"/>' for k, v in self.env.items())
+          """.join([f'<env name="{k}" value="{v}"/>' for k, v in self.env.items()])
             + """
         </environment>
 """
@@ -1017,7 +1032,7 @@ exit 0
 
         """
 
-    @property
+    @functools.cached_property
     def description(self) -> str:
         """The description of this image which is inserted into the
         ``org.opencontainers.image.description`` label.
@@ -1050,7 +1065,7 @@ exit 0
 
         return description.format(**description_formatters)
 
-    @property
+    @functools.cached_property
     def title(self) -> str:
         """The image title that is inserted into the ``org.opencontainers.image.title``
         label.
@@ -1098,13 +1113,9 @@ exit 0
         if readme_template_fname.exists():
             readme_template = readme_template_fname.read_text()
 
-        jinja2_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"),
-            autoescape=jinja2.select_autoescape(["md"]),
-        )
-        return jinja2_env.from_string(readme_template).render(image=self)
+        return _README_ENV.from_string(readme_template).render(image=self)
 
-    @property
+    @functools.cached_property
     def extra_label_lines(self) -> str:
         """Lines for a :file:`Dockerfile` to set the additional labels defined in
         :py:attr:`BaseContainerImage.extra_labels`.
@@ -1114,10 +1125,10 @@ exit 0
             ""
             if not self.extra_labels
             else "\n"
-            + "\n".join(f'LABEL {k}="{v}"' for k, v in self.extra_labels.items())
+            + "\n".join([f'LABEL {k}="{v}"' for k, v in self.extra_labels.items()])
         )
 
-    @property
+    @functools.cached_property
     def extra_label_xml_lines(self) -> str:
         """XML Elements for a kiwi build description to set the additional labels
         defined in :py:attr:`BaseContainerImage.extra_labels`.
@@ -1128,8 +1139,10 @@ exit 0
             return ""
 
         return "\n" + "\n".join(
-            f'            <label name="{k}" value="{v}"/>'
-            for k, v in self.extra_labels.items()
+            [
+                f'            <label name="{k}" value="{v}"/>'
+                for k, v in self.extra_labels.items()
+            ]
         )
 
     @property
@@ -1166,7 +1179,7 @@ exit 0
     @property
     def kiwi_version(self) -> str:
         if self.os_version in (OsVersion.TUMBLEWEED, OsVersion.SLE16_0):
-            return str(datetime.datetime.now().year)
+            return str(_CURRENT_YEAR)
         return f"15.{int(self.os_version.value)}.0"
 
     @property
@@ -1190,19 +1203,18 @@ exit 0
 
         return ",".join(extra_tags) if extra_tags else None
 
-    async def write_files_to_folder(self, dest: str) -> list[str]:
-        """Writes all files required to build this image into the destination folder and
-        returns the filenames (not full paths) that were written to the disk.
+    @functools.cached_property
+    def _files_to_write(self) -> dict[str, str | bytes]:
+        """All build description files of this image by file name. The result
+        is destination independent and rendered only once per image, so
+        writing the same image to several folders skips the template work.
 
         """
-        files = ["_service"]
-        tasks = []
-
-        async def write_file_to_dest(fname: str, contents: str | bytes) -> None:
-            await write_to_file(os.path.join(dest, fname), contents)
+        files_to_write: dict[str, str | bytes] = {
+            "_service": SERVICE_TEMPLATE.render(image=self)
+        }
 
         if self.build_recipe_type == BuildType.DOCKER:
-            fname = "Dockerfile"
             infoheader = textwrap.indent(INFOHEADER_TEMPLATE, "# ")
 
             dockerfile = DOCKERFILE_TEMPLATE.render(
@@ -1214,83 +1226,86 @@ exit 0
             if dockerfile[-1] != "\n":
                 dockerfile += "\n"
 
-            tasks.append(asyncio.ensure_future(write_file_to_dest(fname, dockerfile)))
-            files.append(fname)
+            files_to_write["Dockerfile"] = dockerfile
 
         elif self.build_recipe_type == BuildType.KIWI:
-            fname = f"{self.package_name}.kiwi"
-            tasks.append(
-                asyncio.ensure_future(
-                    write_file_to_dest(
-                        fname,
-                        KIWI_TEMPLATE.render(
-                            image=self, INFOHEADER=INFOHEADER_TEMPLATE
-                        ),
-                    )
-                )
+            files_to_write[f"{self.package_name}.kiwi"] = KIWI_TEMPLATE.render(
+                image=self, INFOHEADER=INFOHEADER_TEMPLATE
             )
-            files.append(fname)
 
             if self.config_sh:
-                tasks.append(
-                    asyncio.ensure_future(
-                        write_file_to_dest("config.sh", self.config_sh)
-                    )
-                )
-                files.append("config.sh")
+                files_to_write["config.sh"] = self.config_sh
 
         else:
             assert (
                 False
             ), f"got an unexpected build_recipe_type: '{self.build_recipe_type}'"
 
-        tasks.append(
-            asyncio.ensure_future(
-                write_file_to_dest("_service", SERVICE_TEMPLATE.render(image=self))
-            )
-        )
-
-        changes_file_name = self.package_name + ".changes"
-        if not (Path(dest) / changes_file_name).exists():
-            name_to_include = self.pretty_name
-            if "%" in name_to_include:
-                name_to_include = self.name.capitalize()
-
-            if hasattr(self, "version"):
-                ver = self.version
-                # we don't want to include the version for language stack
-                # containers with the version_in_uid flag set to False, but by
-                # default we include it (for os containers which don't have this
-                # flag)
-                if str(ver) not in name_to_include and getattr(
-                    self, "version_in_uid", True
-                ):
-                    name_to_include += f" {ver}"
-            tasks.append(
-                asyncio.ensure_future(
-                    write_file_to_dest(
-                        changes_file_name,
-                        f"""-------------------------------------------------------------------
+        name_to_include = self.pretty_name
+        if "%" in name_to_include:
+            name_to_include = self.name.capitalize()
+
+        if hasattr(self, "version"):
+            ver = self.version
+            # we don't want to include the version for language stack
+            # containers with the version_in_uid flag set to False, but by
+            # default we include it (for os containers which don't have this
+            # flag)
+            if str(ver) not in name_to_include and getattr(
+                self, "version_in_uid", True
+            ):
+                name_to_include += f" {ver}"
+        files_to_write[
+            self.package_name + ".changes"
+        ] = f"""-------------------------------------------------------------------
 {datetime.datetime.now(tz=datetime.timezone.utc).strftime("%a %b %d %X %Z %Y")} - SUSE Update Bot <bci-internal@suse.de>
 
 - First version of the {name_to_include} BCI
-""",
-                    )
-                )
-            )
-            files.append(changes_file_name)
+"""
 
-        for fname, contents in self.extra_files.items():
-            files.append(fname)
-            tasks.append(write_file_to_dest(fname, contents))
+        files_to_write.update(self.extra_files)
 
         if "README.md" not in self.extra_files:
-            files.append("README.md")
-            tasks.append(write_file_to_dest("README.md", self.readme))
+            files_to_write["README.md"] = self.readme
+
+        return files_to_write
+
+    async def write_files_to_folder(self, dest: str) -> list[str]:
+        """Writes all files required to build this image into the destination folder and
+        returns the filenames (not full paths) that were written to the disk.
+
+        """
+        # copy so that files skipped for this destination don't mutate the
+        # cached render
+        files_to_write = dict(self._files_to_write)
+        changes_file_name = self.package_name + ".changes"
+
+        os.makedirs(dest, exist_ok=True)
+
+        def _write_all() -> None:
+            for fname, contents in files_to_write.items():
+                mode = "w" if isinstance(contents, str) else "bw"
+                if fname == changes_file_name:
+                    # the changelog is maintained by hand and must never be
+                    # overwritten; creating it with O_CREAT|O_EXCL (mode "x")
+                    # replaces the former stat-then-write dance and is free of
+                    # the race between the check and the write
+                    mode = "x"
+                try:
+                    with open(os.path.join(dest, fname), mode) as dest_file:
+                        dest_file.write(contents)
+                except FileExistsError:
+                    skipped.append(fname)
 
-        await asyncio.gather(*tasks)
+        skipped: list[str] = []
+        # everything has been rendered at this point, so write all files in a
+        # single threadpool job instead of paying one thread hop per file
+        await asyncio.to_thread(_write_all)
 
-        return files
+        for fname in skipped:
+            del files_to_write[fname]
+
+        return list(files_to_write)
 
 
 @dataclass
@@ -1322,11 +1337,11 @@ class DevelopmentContainer(BaseContainerImage):
     def image_type(self) -> ImageType:
         return ImageType.SLE_BCI
 
-    @property
+    @functools.cached_property
     def version_label(self) -> str:
         return str(self.version)
 
-    @property
+    @functools.cached_property
     def uid(self) -> str:
         return f"{self.name}-{self.version}" if self.version_in_uid else self.name
 
@@ -1376,24 +1391,23 @@ class DevelopmentContainer(BaseContainerImage):
             return f"{self._stability_suffix}.%RELEASE%"
         return "%RELEASE%"
 
-    @property
+    @functools.cached_property
     def build_tags(self) -> list[str]:
-        tags = []
+        tags: list[str] = []
 
-        for name in [self.name] + self.additional_names:
-            ver_labels = [self.version_label]
+        for name in (self.name, *self.additional_names):
+            prefix = f"{self._registry_prefix}/{name}:"
+            ver_labels: list[str] = [self.version_label]
             if self.stability_tag:
-                ver_labels = [self.stability_tag] + ver_labels
+                ver_labels.insert(0, self.stability_tag)
             for ver_label in ver_labels + self.additional_versions:
-                tags += [f"{self._registry_prefix}/{name}:{ver_label}"]
-                tags += [
-                    f"{self._registry_prefix}/{name}:{ver_label}-{self._release_suffix}"
-                ]
+                tags.append(prefix + ver_label)
+                tags.append(f"{prefix}{ver_label}-{self._release_suffix}")
             if self.is_latest:
-                tags += [f"{self._registry_prefix}/{name}:latest"]
+                tags.append(prefix + "latest")
         return tags
 
-    @property
+    @functools.cached_property
     def reference(self) -> str:
         return (
             f"{self.registry}/{self._registry_prefix}/{self.name}"
@@ -1477,20 +1491,19 @@ class OsContainer(BaseContainerImage):
 
         return ImageType.SLE_BCI
 
-    @property
+    @functools.cached_property
     def build_tags(self) -> list[str]:
         tags: list[str] = []
 
-        for name in [self.name] + self.additional_names:
-            tags += [
-                f"{self._registry_prefix}/bci-{name}:%OS_VERSION_ID_SP%",
-                f"{self._registry_prefix}/bci-{name}:{self.version_label}",
-            ] + (
-                [f"{self._registry_prefix}/bci-{name}:latest"] if self.is_latest else []
-            )
+        for name in (self.name, *self.additional_names):
+            prefix = f"{self._registry_prefix}/bci-{name}:"
+            tags.append(prefix + "%OS_VERSION_ID_SP%")
+            tags.append(prefix + self.version_label)
+            if self.is_latest:
+                tags.append(prefix + "latest")
         return tags
 
-    @property
+    @functools.cached_property
     def reference(self) -> str:
         return f"{self.registry}/{self._registry_prefix}/bci-{self.name}:{self.version_label}"
 
@@ -1514,93 +1527,117 @@ def generate_disk_size_constraints(size_gb: int) -> str:
 """
 
 
-from .apache_tomcat import TOMCAT_CONTAINERS  # noqa: E402
-from .appcontainers import ALERTMANAGER_CONTAINERS  # noqa: E402
-from .appcontainers import BLACKBOX_EXPORTER_CONTAINERS  # noqa: E402
-from .appcontainers import GIT_CONTAINERS  # noqa: E402
-from .appcontainers import GRAFANA_CONTAINERS  # noqa: E402
-from .appcontainers import HELM_CONTAINERS  # noqa: E402
-from .appcontainers import NGINX_CONTAINERS  # noqa: E402
-from .appcontainers import PCP_CONTAINERS  # noqa: E402
-from .appcontainers import POSTGRES_CONTAINERS  # noqa: E402
-from .appcontainers import PROMETHEUS_CONTAINERS  # noqa: E402
-from .appcontainers import REGISTRY_CONTAINERS  # noqa: E402
-from .appcontainers import THREE_EIGHT_NINE_DS_CONTAINERS  # noqa: E402
-from .appcontainers import TRIVY_CONTAINERS  # noqa: E402
-from .base import BASE_CONTAINERS  # noqa: E402
-from .basecontainers import BUSYBOX_CONTAINERS  # noqa: E402
-from .basecontainers import FIPS_BASE_CONTAINERS  # noqa: E402
-from .basecontainers import GITEA_RUNNER_CONTAINER  # noqa: E402
-from .basecontainers import INIT_CONTAINERS  # noqa: E402
-from .basecontainers import KERNEL_MODULE_CONTAINERS  # noqa: E402
-from .basecontainers import MICRO_CONTAINERS  # noqa: E402
-from .basecontainers import MINIMAL_CONTAINERS  # noqa: E402
-from .gcc import GCC_CONTAINERS  # noqa: E402
-from .golang import GOLANG_CONTAINERS  # noqa: E402
-from .kiwi import KIWI_CONTAINERS  # noqa: E402
-from .mariadb import MARIADB_CLIENT_CONTAINERS  # noqa: E402
-from .mariadb import MARIADB_CONTAINERS  # noqa: E402
-from .node import NODE_CONTAINERS  # noqa: E402
-from .openjdk import OPENJDK_CONTAINERS  # noqa: E402
-from .php import PHP_CONTAINERS  # noqa: E402
-from .postfix import POSTFIX_CONTAINERS  # noqa: E402
-from .python import PYTHON_3_6_CONTAINERS  # noqa: E402
-from .python import PYTHON_3_11_CONTAINERS  # noqa: E402
-from .python import PYTHON_3_12_CONTAINERS  # noqa: E402
-from .python import PYTHON_TW_CONTAINERS  # noqa: E402
-from .rmt import RMT_CONTAINERS  # noqa: E402
-from .ruby import RUBY_CONTAINERS  # noqa: E402
-from .rust import RUST_CONTAINERS  # noqa: E402
-from .spack import SPACK_CONTAINERS  # noqa: E402
-
-ALL_CONTAINER_IMAGE_NAMES: dict[str, BaseContainerImage] = {
-    f"{bci.uid}-{bci.os_version.pretty_print.lower()}": bci
-    for bci in (
-        *BASE_CONTAINERS,
-        PYTHON_3_12_CONTAINERS,
-        *PYTHON_3_6_CONTAINERS,
-        *PYTHON_3_11_CONTAINERS,
-        *PYTHON_TW_CONTAINERS,
-        *THREE_EIGHT_NINE_DS_CONTAINERS,
-        *NGINX_CONTAINERS,
-        *PCP_CONTAINERS,
-        *REGISTRY_CONTAINERS,
-        *HELM_CONTAINERS,
-        *TRIVY_CONTAINERS,
-        *RMT_CONTAINERS,
-        *RUST_CONTAINERS,
-        *GIT_CONTAINERS,
-        *GOLANG_CONTAINERS,
-        *KIWI_CONTAINERS,
-        *RUBY_CONTAINERS,
-        *NODE_CONTAINERS,
-        *OPENJDK_CONTAINERS,
-        *PHP_CONTAINERS,
-        *INIT_CONTAINERS,
-        *FIPS_BASE_CONTAINERS,
-        *MARIADB_CONTAINERS,
-        *MARIADB_CLIENT_CONTAINERS,
-        *POSTFIX_CONTAINERS,
-        *POSTGRES_CONTAINERS,
-        *PROMETHEUS_CONTAINERS,
-        *ALERTMANAGER_CONTAINERS,
-        *BLACKBOX_EXPORTER_CONTAINERS,
-        *GRAFANA_CONTAINERS,
-        *MINIMAL_CONTAINERS,
-        *MICRO_CONTAINERS,
-        *BUSYBOX_CONTAINERS,
-        *KERNEL_MODULE_CONTAINERS,
-        GITEA_RUNNER_CONTAINER,
-        *TOMCAT_CONTAINERS,
-        *GCC_CONTAINERS,
-        *SPACK_CONTAINERS,
-    )
-}
+@functools.cache
+def _get_all_container_image_names() -> dict[str, BaseContainerImage]:
+    """Build the registry of all container images by their uid-osversion name.
+
+    Importing every container module is by far the most expensive part of
+    loading this package, so it is deferred until the registry is actually
+    needed (see the module level ``__getattr__``) and performed only once.
+
+    """
+    from .apache_tomcat import TOMCAT_CONTAINERS
+    from .appcontainers import ALERTMANAGER_CONTAINERS
+    from .appcontainers import BLACKBOX_EXPORTER_CONTAINERS
+    from .appcontainers import GIT_CONTAINERS
+    from .appcontainers import GRAFANA_CONTAINERS
+    from .appcontainers import HELM_CONTAINERS
+    from .appcontainers import NGINX_CONTAINERS
+    from .appcontainers import PCP_CONTAINERS
+    from .appcontainers import POSTGRES_CONTAINERS
+    from .appcontainers import PROMETHEUS_CONTAINERS
+    from .appcontainers import REGISTRY_CONTAINERS
+    from .appcontainers import THREE_EIGHT_NINE_DS_CONTAINERS
+    from .appcontainers import TRIVY_CONTAINERS
+    from .base import BASE_CONTAINERS
+    from .basecontainers import BUSYBOX_CONTAINERS
+    from .basecontainers import FIPS_BASE_CONTAINERS
+    from .basecontainers import GITEA_RUNNER_CONTAINER
+    from .basecontainers import INIT_CONTAINERS
+    from .basecontainers import KERNEL_MODULE_CONTAINERS
+    from .basecontainers import MICRO_CONTAINERS
+    from .basecontainers import MINIMAL_CONTAINERS
+    from .gcc import GCC_CONTAINERS
+    from .golang import GOLANG_CONTAINERS
+    from .kiwi import KIWI_CONTAINERS
+    from .mariadb import MARIADB_CLIENT_CONTAINERS
+    from .mariadb import MARIADB_CONTAINERS
+    from .node import NODE_CONTAINERS
+    from .openjdk import OPENJDK_CONTAINERS
+    from .php import PHP_CONTAINERS
+    from .postfix import POSTFIX_CONTAINERS
+    from .python import PYTHON_3_6_CONTAINERS
+    from .python import PYTHON_3_11_CONTAINERS
+    from .python import PYTHON_3_12_CONTAINERS
+    from .python import PYTHON_TW_CONTAINERS
+    from .rmt import RMT_CONTAINERS
+    from .ruby import RUBY_CONTAINERS
+    from .rust import RUST_CONTAINERS
+    from .spack import SPACK_CONTAINERS
+
+    return {
+        f"{bci.uid}-{bci.os_version.pretty_print.lower()}": bci
+        for bci in (
+            *BASE_CONTAINERS,
+            PYTHON_3_12_CONTAINERS,
+            *PYTHON_3_6_CONTAINERS,
+            *PYTHON_3_11_CONTAINERS,
+            *PYTHON_TW_CONTAINERS,
+            *THREE_EIGHT_NINE_DS_CONTAINERS,
+            *NGINX_CONTAINERS,
+            *PCP_CONTAINERS,
+            *REGISTRY_CONTAINERS,
+            *HELM_CONTAINERS,
+            *TRIVY_CONTAINERS,
+            *RMT_CONTAINERS,
+            *RUST_CONTAINERS,
+            *GIT_CONTAINERS,
+            *GOLANG_CONTAINERS,
+            *KIWI_CONTAINERS,
+            *RUBY_CONTAINERS,
+            *NODE_CONTAINERS,
+            *OPENJDK_CONTAINERS,
+            *PHP_CONTAINERS,
+            *INIT_CONTAINERS,
+            *FIPS_BASE_CONTAINERS,
+            *MARIADB_CONTAINERS,
+            *MARIADB_CLIENT_CONTAINERS,
+            *POSTFIX_CONTAINERS,
+            *POSTGRES_CONTAINERS,
+            *PROMETHEUS_CONTAINERS,
+            *ALERTMANAGER_CONTAINERS,
+            *BLACKBOX_EXPORTER_CONTAINERS,
+            *GRAFANA_CONTAINERS,
+            *MINIMAL_CONTAINERS,
+            *MICRO_CONTAINERS,
+            *BUSYBOX_CONTAINERS,
+            *KERNEL_MODULE_CONTAINERS,
+            GITEA_RUNNER_CONTAINER,
+            *TOMCAT_CONTAINERS,
+            *GCC_CONTAINERS,
+            *SPACK_CONTAINERS,
+        )
+    }
 
-SORTED_CONTAINER_IMAGE_NAMES = sorted(
-    ALL_CONTAINER_IMAGE_NAMES,
-    key=lambda bci: str(ALL_CONTAINER_IMAGE_NAMES[bci].os_version),
-)
+
+@functools.cache
+def _get_sorted_container_image_names() -> tuple[str, ...]:
+    all_images = _get_all_container_image_names()
+    return tuple(sorted(all_images, key=lambda bci: str(all_images[bci].os_version)))
+
+
+def __getattr__(name: str):
+    """Resolve ``ALL_CONTAINER_IMAGE_NAMES`` and
+    ``SORTED_CONTAINER_IMAGE_NAMES`` lazily (:pep:`562`), so that importing
+    this module for its classes and constants does not pull in every
+    container definition module.
+
+    """
+    if name == "ALL_CONTAINER_IMAGE_NAMES":
+        return _get_all_container_image_names()
+    if name == "SORTED_CONTAINER_IMAGE_NAMES":
+        return _get_sorted_container_image_names()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
@@ -1613,9 +1650,9 @@ def main() -> None:
     parser.add_argument(
         "image",
         type=str,
-        nargs=1,
-        choices=SORTED_CONTAINER_IMAGE_NAMES,
-        help="The BCI container image, which package contents should be written to the disk",
+        nargs="+",
+        choices=_get_sorted_container_image_names(),
+        help="The BCI container image(s), which package contents should be written to the disk",
     )
     parser.add_argument(
         "destination",
@@ -1626,9 +1663,17 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(
-        ALL_CONTAINER_IMAGE_NAMES[args.image[0]].write_files_to_folder(
-            args.destination[0]
+    async def _write_all() -> None:
+        # a single image is written directly into the destination (the
+        # historic CLI behavior), multiple images each get their own
+        # subdirectory and are written concurrently
+        if len(args.image) == 1:
+            dest = {args.image[0]: args.destination[0]}
+        else:
+            dest = {img: os.path.join(args.destination[0], img) for img in args.image}
+        images = _get_all_container_image_names()
+        await asyncio.gather(
+            *(images[img].write_files_to_folder(dest[img]) for img in args.image)
         )
-    )
+
+    asyncio.run(_write_all())
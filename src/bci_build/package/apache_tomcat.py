@@ -1,6 +1,7 @@
 """Provide an Apache Tomcat container."""
 
 import datetime
+import functools
 
 from bci_build.package import CAN_BE_LATEST_OS_VERSION
 from bci_build.package import DOCKERFILE_RUN
@@ -10,8 +11,49 @@ from bci_build.package import Replacement
 
 from .appcollection import ApplicationCollectionContainer
 
+# must stay sorted, the latest version is the last element (checked by the
+# test suite instead of an import-time assert)
 _TOMCAT_VERSIONS: list[int] = [9, 10]
-assert _TOMCAT_VERSIONS == sorted(_TOMCAT_VERSIONS)
+
+#: rpm package of each tomcat major version; the oldest supported major ships
+#: as plain ``tomcat``
+_TOMCAT_PKG_BY_MAJOR: dict[int, str] = {
+    major: ("tomcat" if major == _TOMCAT_VERSIONS[0] else f"tomcat{major}")
+    for major in _TOMCAT_VERSIONS
+}
+
+_CATALINA_HOME = "/usr/share/tomcat"
+
+#: os versions where the tomcat server launcher lives in :file:`/usr/libexec`
+#: instead of :file:`/usr/lib`
+_LIBEXEC_OS_VERSIONS = frozenset((OsVersion.TUMBLEWEED, OsVersion.SLE16_0))
+
+
+@functools.cache
+def _get_replacements(tomcat_pkg: str) -> tuple[Replacement, ...]:
+    """Return the version replacements for ``tomcat_pkg``; the ``Replacement``
+    instances are shared between all containers with the same tomcat package.
+
+    """
+    return (
+        Replacement(
+            regex_in_build_description="%%tomcat_version%%", package_name=tomcat_pkg
+        ),
+        Replacement(
+            regex_in_build_description="%%tomcat_minor%%",
+            package_name=tomcat_pkg,
+            parse_version=ParseVersion.MINOR,
+        ),
+    )
+
+
+def _get_package_name(
+    tomcat_major: int, jre_version: int, os_version: OsVersion
+) -> str:
+    """Return the OBS source package name for this tomcat/JRE combination."""
+    if os_version.is_tumbleweed:
+        return f"apache-tomcat-{tomcat_major}-java-{jre_version}-image"
+    return f"sac-apache-tomcat-{tomcat_major}-java{jre_version}-image"
 
 
 def _get_sac_supported_until(
@@ -45,13 +87,15 @@ def _get_sac_supported_until(
     )
 
 
-TOMCAT_CONTAINERS = [
-    ApplicationCollectionContainer(
+def _create_tomcat_container(
+    tomcat_major: int, os_version: OsVersion, jre_version: int
+) -> ApplicationCollectionContainer:
+    """Create the Apache Tomcat container for one row of the version matrix."""
+    tomcat_pkg = _TOMCAT_PKG_BY_MAJOR[tomcat_major]
+    return ApplicationCollectionContainer(
         name="apache-tomcat",
         pretty_name="Apache Tomcat",
-        package_name=f"apache-tomcat-{tomcat_major}-java-{jre_version}-image"
-        if os_version.is_tumbleweed
-        else f"sac-apache-tomcat-{tomcat_major}-java{jre_version}-image",
+        package_name=_get_package_name(tomcat_major, jre_version, os_version),
         os_version=os_version,
         is_latest=(
             (os_version in CAN_BE_LATEST_OS_VERSION)
@@ -68,52 +112,46 @@ TOMCAT_CONTAINERS = [
             f"%%tomcat_minor%%-jre{jre_version}",
         ],
         package_list=[
-            tomcat_pkg := (
-                "tomcat"
-                if tomcat_major == _TOMCAT_VERSIONS[0]
-                else f"tomcat{tomcat_major}"
-            )
-        ]
-        + [f"java-{jre_version}-openjdk", f"java-{jre_version}-openjdk-headless"],
-        replacements_via_service=[
-            Replacement(
-                regex_in_build_description="%%tomcat_version%%", package_name=tomcat_pkg
-            ),
-            Replacement(
-                regex_in_build_description="%%tomcat_minor%%",
-                package_name=tomcat_pkg,
-                parse_version=ParseVersion.MINOR,
-            ),
+            tomcat_pkg,
+            f"java-{jre_version}-openjdk",
+            f"java-{jre_version}-openjdk-headless",
         ],
+        replacements_via_service=list(_get_replacements(tomcat_pkg)),
         cmd=[
-            f"/usr/{'libexec' if os_version in( OsVersion.TUMBLEWEED, OsVersion.SLE16_0) else 'lib'}/tomcat/server",
+            f"/usr/{'libexec' if os_version in _LIBEXEC_OS_VERSIONS else 'lib'}/tomcat/server",
             "start",
         ],
         exposes_tcp=[8080],
         env={
             "TOMCAT_MAJOR": tomcat_major,
             "TOMCAT_VERSION": "%%tomcat_version%%",
-            "CATALINA_HOME": (_CATALINA_HOME := "/usr/share/tomcat"),
+            "CATALINA_HOME": _CATALINA_HOME,
             "CATALINA_BASE": _CATALINA_HOME,
             "PATH": f"{_CATALINA_HOME}/bin:$PATH",
         },
-        custom_end=rf"""{DOCKERFILE_RUN} mkdir -p /var/log/tomcat; chown --recursive tomcat:tomcat /var/log/tomcat;
-{DOCKERFILE_RUN} \
-    sed -i /etc/tomcat/logging.properties \
-        -e 's|org\.apache\.catalina\.core\.ContainerBase\.\[Catalina\]\.\[localhost\]\.handlers =.*|org.apache.catalina.core.ContainerBase.[Catalina].[localhost].handlers = java.util.logging.ConsoleHandler|' \
-        -e 's|org\.apache\.catalina\.core\.ContainerBase\.\[Catalina\]\.\[localhost\]\.\[/manager\]\.handlers =.*|org.apache.catalina.core.ContainerBase.[Catalina].[localhost].[/manager].handlers = java.util.logging.ConsoleHandler|' \
-        -e 's|org\.apache\.catalina\.core\.ContainerBase\.\[Catalina\]\.\[localhost\]\.\[/host-manager\]\.handlers =.*|org.apache.catalina.core.ContainerBase.[Catalina].[localhost].[/host-manager].handlers = java.util.logging.ConsoleHandler|'
+        custom_end=rf"""{DOCKERFILE_RUN} \
+    mkdir -p /var/log/tomcat && \
+    chown --recursive tomcat:tomcat /var/log/tomcat && \
+    sed -i -E /etc/tomcat/logging.properties \
+        -e 's|(org\.apache\.catalina\.core\.ContainerBase\.\[Catalina\]\.\[localhost\](\.\[/(host-)?manager\])?)\.handlers =.*|\1.handlers = java.util.logging.ConsoleHandler|'
 
 WORKDIR $CATALINA_HOME
 """,
         entrypoint_user="tomcat",
         logo_url="https://tomcat.apache.org/res/images/tomcat.png",
     )
-    for tomcat_major, os_version, jre_version in (
-        (10, OsVersion.TUMBLEWEED, 22),
-        (10, OsVersion.TUMBLEWEED, 21),
-        (10, OsVersion.TUMBLEWEED, 17),
-        (9, OsVersion.TUMBLEWEED, 17),
-        (10, OsVersion.SP6, 21),
-    )
-]
+
+
+#: the shipped (tomcat major, os version, JRE major) combinations
+_TOMCAT_MATRIX: tuple[tuple[int, OsVersion, int], ...] = (
+    (10, OsVersion.TUMBLEWEED, 22),
+    (10, OsVersion.TUMBLEWEED, 21),
+    (10, OsVersion.TUMBLEWEED, 17),
+    (9, OsVersion.TUMBLEWEED, 17),
+    (10, OsVersion.SP6, 21),
+)
+
+TOMCAT_CONTAINERS = tuple(
+    _create_tomcat_container(tomcat_major, os_version, jre_version)
+    for tomcat_major, os_version, jre_version in _TOMCAT_MATRIX
+)
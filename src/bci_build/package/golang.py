@@ -1,7 +1,6 @@
 """Go language BCI containers"""
 
 import textwrap
-from itertools import product
 from typing import Literal
 
 from bci_build.package import CAN_BE_LATEST_OS_VERSION
@@ -90,21 +89,17 @@ def _get_golang_kwargs(
 GOLANG_CONTAINERS = (
     [
         DevelopmentContainer(
-            **_get_golang_kwargs(ver, govariant, sle15sp),
+            **_get_golang_kwargs(ver, "", OsVersion.SP6),
             support_level=SupportLevel.L3,
         )
-        for ver, govariant, sle15sp in product(
-            _GOLANG_VERSIONS, ("",), (OsVersion.SP6,)
-        )
+        for ver in _GOLANG_VERSIONS
     ]
     + [
         DevelopmentContainer(
-            **_get_golang_kwargs(ver, govariant, sle15sp),
+            **_get_golang_kwargs(ver, "-openssl", OsVersion.SP6),
             support_level=SupportLevel.L3,
         )
-        for ver, govariant, sle15sp in product(
-            _GOLANG_OPENSSL_VERSIONS, ("-openssl",), (OsVersion.SP6,)
-        )
+        for ver in _GOLANG_OPENSSL_VERSIONS
     ]
     + [
         DevelopmentContainer(**_get_golang_kwargs(ver, "", OsVersion.TUMBLEWEED))
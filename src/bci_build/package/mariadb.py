@@ -1,5 +1,6 @@
 """Container definition for the MariaDB database server and client."""
 
+import functools
 import re
 from pathlib import Path
 
@@ -29,6 +30,38 @@ fi
 setpriv --reuid=$u --regid=$u --clear-groups -- /bin/bash "$@"
 """
 
+#: directory with the version specific entrypoint & healthcheck scripts
+_MARIADB_DIR = Path(__file__).parent / "mariadb"
+
+_MARIADB_VERSION_REGEX = "%%mariadb_version%%"
+
+
+@functools.cache
+def _get_entrypoint(mariadb_version: str) -> str:
+    """Read the upstream entrypoint for ``mariadb_version`` with the hardcoded
+    version number replaced by the ``replace_using_pkg_version`` regex.
+
+    The result is cached as multiple os versions can ship the same mariadb
+    version.
+
+    """
+    docker_entrypoint = (_MARIADB_DIR / mariadb_version / "entrypoint.sh").read_text()
+    # Patch up the version number to be the exact x.y.z version that we ship
+    # using the replace_using_pkg_version service
+    # Although the current version is not checking the patch level, this might
+    # change in the future
+    return re.sub(
+        f'echo -n "{mariadb_version}.*-MariaDB"',
+        f'echo -n "{_MARIADB_VERSION_REGEX}-MariaDB"',
+        docker_entrypoint,
+    )
+
+
+@functools.cache
+def _get_healthcheck(mariadb_version: str) -> bytes:
+    return (_MARIADB_DIR / mariadb_version / "healthcheck.sh").read_bytes()
+
+
 MARIADB_CONTAINERS = []
 MARIADB_CLIENT_CONTAINERS = []
 
@@ -46,25 +79,11 @@ for os_version in ALL_NONBASE_OS_VERSIONS:
         "mariadb-client", mariadb_version
     )
 
-    docker_entrypoint = (
-        Path(__file__).parent / "mariadb" / str(mariadb_version) / "entrypoint.sh"
-    ).read_text()
-    # Patch up the version number to be the exact x.y.z version that we ship
-    # using the replace_using_pkg_version service
-    # Although the current version is not checking the patch level, this might
-    # change in the future
-    _MARIADB_VERSION_REGEX = "%%mariadb_version%%"
-    docker_entrypoint = re.sub(
-        f'echo -n "{mariadb_version}.*-MariaDB"',
-        f'echo -n "{_MARIADB_VERSION_REGEX}-MariaDB"',
-        docker_entrypoint,
-    )
+    docker_entrypoint = _get_entrypoint(str(mariadb_version))
 
     _ENTRYPOINT_FNAME = "docker-entrypoint.sh"
 
-    healthcheck = (
-        Path(__file__).parent / "mariadb" / str(mariadb_version) / "healthcheck.sh"
-    ).read_bytes()
+    healthcheck = _get_healthcheck(str(mariadb_version))
 
     MARIADB_CONTAINERS.append(
         ApplicationStackContainer(
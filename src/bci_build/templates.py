@@ -23,9 +23,7 @@ You can contact the BCI team via https://github.com/SUSE/bci/discussions
 """
 
 
-#: Jinja2 template used to generate :file:`Dockerfile`
-DOCKERFILE_TEMPLATE = jinja2.Template(
-    """# SPDX-License-Identifier: {{ image.license }}
+_DOCKERFILE_TEMPLATE_SOURCE = """# SPDX-License-Identifier: {{ image.license }}
 {{ INFOHEADER }}
 {% if image.exclusive_arch %}#!ExclusiveArch: {% for arch in image.exclusive_arch %}{{ arch }}{{ " " if not loop.last }}{% endfor %}
 {%- endif %}
@@ -82,11 +80,8 @@ LABEL io.artifacthub.package.logo-url="{{ image.logo_url }}"
 {%- if image.entrypoint_user %}USER {{ image.entrypoint_user }}{% endif %}
 {%- if image.volume_dockerfile %}{{ image.volume_dockerfile }}{% endif %}
 """
-)
 
-#: Jinja2 template used to generate :file:`$pkg_name.kiwi`
-KIWI_TEMPLATE = jinja2.Template(
-    """<?xml version="1.0" encoding="utf-8"?>
+_KIWI_TEMPLATE_SOURCE = """<?xml version="1.0" encoding="utf-8"?>
 <!-- SPDX-License-Identifier: {{ image.license }} -->
 <!-- {{ INFOHEADER }}-->
 <!-- OBS-AddTag: {% for tag in image.build_tags -%} {{ tag }} {% endfor -%}-->
@@ -161,11 +156,8 @@ KIWI_TEMPLATE = jinja2.Template(
 {{ image.kiwi_packages }}
 </image>
 """
-)
 
-#: Jinja2 template used to generate :file:`_service`.
-SERVICE_TEMPLATE = jinja2.Template(
-    """<services>
+_SERVICE_TEMPLATE_SOURCE = """<services>
   <service mode="buildtime" name="{{ image.build_recipe_type }}_label_helper"/>
   <service mode="buildtime" name="kiwi_metainfo_helper"/>
 {%- for replacement in image.replacements_via_service %}
@@ -177,4 +169,31 @@ SERVICE_TEMPLATE = jinja2.Template(
   </service>{% endfor %}
 </services>
 """
+
+#: Jinja2 environment from which all build description templates are
+#: resolved. Using a single environment ensures that every template is compiled
+#: exactly once per process and not for every rendered image.
+_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader(
+        {
+            "Dockerfile": _DOCKERFILE_TEMPLATE_SOURCE,
+            "kiwi": _KIWI_TEMPLATE_SOURCE,
+            "_service": _SERVICE_TEMPLATE_SOURCE,
+        }
+    ),
+    auto_reload=False,
+    cache_size=-1,
+    # the CLI is typically invoked once per package, so keep the compiled
+    # template bytecode in a per-user cache below $TMPDIR to skip recompiling
+    # the templates on every process start
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
 )
+
+#: Jinja2 template used to generate :file:`Dockerfile`
+DOCKERFILE_TEMPLATE = _ENV.get_template("Dockerfile")
+
+#: Jinja2 template used to generate :file:`$pkg_name.kiwi`
+KIWI_TEMPLATE = _ENV.get_template("kiwi")
+
+#: Jinja2 template used to generate :file:`_service`.
+SERVICE_TEMPLATE = _ENV.get_template("_service")
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
 from datetime import timedelta
+from functools import cached_property
 from functools import reduce
 from typing import ClassVar
 from typing import Literal
@@ -205,12 +206,12 @@ class StagingBot:
             res += f"SLE-15-SP{str(self.os_version)}"
         return res
 
-    @property
+    @cached_property
     def continuous_rebuild_project_name(self) -> str:
         """The name of the continuous rebuild project on OBS."""
         return self._generate_project_name("BCI:CR")
 
-    @property
+    @cached_property
     def staging_project_name(self) -> str:
         """The name of the staging project on OBS.
 
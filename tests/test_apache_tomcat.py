@@ -0,0 +1,9 @@
+from bci_build.package.apache_tomcat import _TOMCAT_VERSIONS
+
+
+def test_tomcat_versions_are_sorted():
+    """The container definitions rely on ``_TOMCAT_VERSIONS[-1]`` being the
+    latest version, so the list must stay sorted.
+
+    """
+    assert _TOMCAT_VERSIONS == sorted(_TOMCAT_VERSIONS)
@@ -1,3 +1,7 @@
+import pytest
+
+from bci_build.package import ALL_CONTAINER_IMAGE_NAMES
+from bci_build.package import SORTED_CONTAINER_IMAGE_NAMES
 from tests.conftest import BCI_FIXTURE_RET_T
 
 
@@ -134,3 +138,15 @@ def test_volume_dockerfile(bci: BCI_FIXTURE_RET_T):
         cls(**kwargs, volumes=["/var/log", "/sys/"]).volume_dockerfile
         == "\nVOLUME /var/log /sys/"
     )
+
+
+@pytest.mark.parametrize("container_name", SORTED_CONTAINER_IMAGE_NAMES)
+def test_all_images_render(container_name: str):
+    """Regression test that every registered image can render its full set of
+    build description files (the tomcat README used to blow up on a string vs
+    int comparison of ``TOMCAT_MAJOR``).
+
+    """
+    files = ALL_CONTAINER_IMAGE_NAMES[container_name]._files_to_write
+
+    assert "_service" in files and "README.md" in files